@@ -0,0 +1,13 @@
+# Numba is an optional dependency and slow to import, so data_processing only imports
+# this module the first time it needs one of these kernels
+from numba import njit, prange
+
+@njit(parallel=True, cache=True)
+def keep_within_bounds(keep, values, lower, upper):
+    """
+    Clear the entries of `keep` whose value lies outside [lower, upper], in place.
+    """
+    for i in prange(values.shape[0]):
+        # Written as a negated range check so NaN values are dropped, like the NumPy comparison
+        if keep[i] and not (values[i] >= lower and values[i] <= upper):
+            keep[i] = False
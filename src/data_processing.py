@@ -1,7 +1,164 @@
+from importlib.util import find_spec
 import numpy as np
 import pandas as pd
 
-def preprocess_data(df: pd.DataFrame, fill_strategy: str) -> pd.DataFrame:
+def _sorted_quantiles(sorted_values: np.ndarray, q: list) -> np.ndarray:
+    """
+    Helper function to read linearly interpolated quantiles off an ascending-sorted array.
+    """
+    # np.sort places NaNs last, so only the leading non-NaN values are ranked
+    count = np.count_nonzero(~np.isnan(sorted_values))
+    positions = np.asarray(q, dtype=np.float64) * (count - 1)
+    lower = np.floor(positions).astype(np.intp)
+    upper = np.ceil(positions).astype(np.intp)
+    weight = positions - lower
+    return sorted_values[lower] * (1 - weight) + sorted_values[upper] * weight
+
+
+# Below this many rows the NumPy comparison takes well under a millisecond, far less than
+# importing Numba and loading the compiled kernel, so the kernel only pays off on large inputs
+_NUMBA_MIN_ROWS = 1_000_000
+
+
+def _apply_bounds(mask: np.ndarray, values: np.ndarray, lower: float, upper: float) -> None:
+    """
+    Helper function to clear the rows of `mask` whose value lies outside [lower, upper].
+    """
+    if values.shape[0] >= _NUMBA_MIN_ROWS and find_spec('numba') is not None:
+        from ._numba_kernels import keep_within_bounds
+        keep_within_bounds(mask, values, lower, upper)
+    else:
+        mask &= (values >= lower) & (values <= upper)
+
+
+_FILL_STATS = {
+    'mean': lambda block: np.nanmean(block, axis=0),
+    'median': lambda block: np.nanmedian(block, axis=0),
+    # NumPy has no NaN-aware mode, so defer to pandas for this one
+    'mode': lambda block: pd.DataFrame(block).mode().iloc[0].to_numpy(),
+}
+
+
+def _impute_block(block: np.ndarray, fill_strategy: str):
+    """
+    Helper function to fill NaNs in a 2-D float array; returns which columns had gaps and their filled copies.
+    """
+    mask = np.isnan(block)
+    has_missing = mask.any(axis=0)
+    # Fancy indexing copies, so the input block is never written to
+    filled = block[:, has_missing]
+    if has_missing.any():
+        fill_values = _FILL_STATS[fill_strategy](filled)
+        rows, cols = np.nonzero(mask[:, has_missing])
+        filled[rows, cols] = fill_values[cols]
+    return has_missing, filled
+
+
+def _clean_columns(df: pd.DataFrame, fill_strategy: str, deep: bool) -> pd.DataFrame:
+    """
+    Helper function to rename the target, impute numeric gaps and convert text columns to categoricals.
+    """
+    if fill_strategy not in _FILL_STATS:
+        raise ValueError(f"Fill strategy '{fill_strategy}' not recognized.")
+
+    # With deep=False the copy shares the caller's column data instead of cloning it. Every
+    # change below replaces whole columns or renames them, so the caller's frame is never written to
+    df = df.copy(deep=deep)
+
+    # Rename target for consistency
+    if 'median_house_value' in df.columns:
+        df.rename(columns={'median_house_value': 'Price'}, inplace=True)
+
+    # Handle Missing Values
+    num_cols = df.select_dtypes(include=[np.number]).columns
+    block = df[num_cols].to_numpy(dtype=np.float64)
+    has_missing, filled = _impute_block(block, fill_strategy)
+    for col, values in zip(num_cols[has_missing], filled.T):
+        df[col] = values
+
+    # Store text columns as categoricals so downstream ops work on integer codes
+    for col in df.select_dtypes(include=['object', 'string']).columns:
+        df[col] = df[col].astype('category')
+
+    return df
+
+
+def _add_ratio_features(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Helper function to add Rooms_Per_Household and Bedrooms_Per_Room, computed into preallocated arrays.
+    """
+    total_rooms = df['total_rooms'].to_numpy(dtype=np.float64)
+    households = df['households'].to_numpy(dtype=np.float64)
+    total_bedrooms = df['total_bedrooms'].to_numpy(dtype=np.float64)
+    rooms_per_household = np.empty_like(total_rooms)
+    bedrooms_per_room = np.empty_like(total_rooms)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        np.divide(total_rooms, households, out=rooms_per_household)
+        np.divide(total_bedrooms, total_rooms, out=bedrooms_per_room)
+    df['Rooms_Per_Household'] = rooms_per_household
+    df['Bedrooms_Per_Room'] = bedrooms_per_room
+    return df
+
+
+def _outlier_mask(df: pd.DataFrame, columns: list) -> np.ndarray:
+    """
+    Helper function to flag the rows kept by filtering each column on its 1.5 * IQR bounds in turn.
+    """
+    for col in columns:
+        if col not in df.columns:
+            raise KeyError(f"Column '{col}' not found in DataFrame.")
+
+    values = df[columns].to_numpy(dtype=np.float64)
+    mask = np.ones(values.shape[0], dtype=bool)
+    for j in range(values.shape[1]):
+        if not mask.any():
+            break
+
+        # Bounds come from the rows kept so far, as if the frame were filtered column by column.
+        # Sorting once turns every quantile into an index lookup.
+        Q1, Q3 = _sorted_quantiles(np.sort(values[mask, j]), [0.25, 0.75])
+        IQR = Q3 - Q1
+        lower_bound = Q1 - 1.5 * IQR
+        upper_bound = Q3 + 1.5 * IQR
+
+        # NaN compares False, so rows missing a value in this column are dropped
+        _apply_bounds(mask, values[:, j], lower_bound, upper_bound)
+
+    return mask
+
+
+def load_data(file_path: str) -> pd.DataFrame:
+    """
+    Load a CSV file, using the multi-threaded PyArrow parser when it is installed.
+
+    Columns are returned with standard NumPy dtypes, since the processing functions
+    below operate on NumPy blocks.
+
+    Parameters:
+    ----------
+    file_path : str
+        Path to the CSV file.
+
+    Returns:
+    ----------
+    pd.DataFrame
+        The loaded data.
+
+    Raises:
+    ----------
+    FileNotFoundError
+        If the file does not exist.
+    """
+    try:
+        # PyArrow is optional; only check that it is installed, pandas imports it on use
+        engine = 'pyarrow' if find_spec('pyarrow') is not None else 'c'
+        return pd.read_csv(file_path, engine=engine)
+    except Exception as e:
+        print(f"Error loading data: {e}")
+        raise
+
+
+def preprocess_data(df: pd.DataFrame, fill_strategy: str, copy: bool = True) -> pd.DataFrame:
     """
     Clean and preprocess the input DataFrame.
 
@@ -11,6 +168,9 @@ def preprocess_data(df: pd.DataFrame, fill_strategy: str) -> pd.DataFrame:
         Raw input data to be processed.
     fill_strategy : str, optional
         Strategy to fill missing values ('mean','median','mode').
+    copy : bool, default True
+        If False, skip the full copy of df: columns that are not imputed or converted are
+        shared with df, so in-place edits to either frame show up in both.
 
     Returns:
     ----------
@@ -23,26 +183,10 @@ def preprocess_data(df: pd.DataFrame, fill_strategy: str) -> pd.DataFrame:
         If fill_strategy is not recognized.
     """
     try:
-        df = df.copy()
-        # Rename target for consistency
-        if 'median_house_value' in df.columns:
-            df = df.rename(columns={'median_house_value': 'Price'})
-
-        # Handle Missing Values
-        for col in df.select_dtypes(include=[np.number]).columns:
-            if df[col].isnull().any():
-                if fill_strategy == 'mean':
-                    df[col] = df[col].fillna(df[col].mean())
-                elif fill_strategy == 'median':
-                    df[col] = df[col].fillna(df[col].median())
-                elif fill_strategy == 'mode':
-                    df[col] = df[col].fillna(df[col].mode()[0])
-                else:
-                    raise ValueError(f"Fill strategy '{fill_strategy}' not recognized.")
+        df = _clean_columns(df, fill_strategy, deep=copy)
 
         # Create Derived Features
-        df['Rooms_Per_Household'] = df['total_rooms'] / df['households']
-        df['Bedrooms_Per_Room'] = df['total_bedrooms'] / df['total_rooms']
+        df = _add_ratio_features(df)
 
         return df
     except Exception as e:
@@ -72,24 +216,45 @@ def handle_outliers(df: pd.DataFrame, columns: list) -> pd.DataFrame:
         If any of the specified columns are not present in the DataFrame.
     """
     try:
-        df = df.copy()
-        for col in columns:
-            if col not in df.columns:
-                raise KeyError(f"Column '{col}' not found in DataFrame.")
-
-            Q1 = df[col].quantile(0.25)
-            Q3 = df[col].quantile(0.75)
-            IQR = Q3 - Q1
-            lower_bound = Q1 - 1.5 * IQR
-            upper_bound = Q3 + 1.5 * IQR
-
-            # Capping outliers to prevent data loss while maintaining data integrity
-            df = df[(df[col] >= lower_bound) & (df[col] <= upper_bound)]
-
-        return df
+        return df.loc[_outlier_mask(df, columns)]
     except Exception as e:
         print(f"Error handling outliers: {e}")
         raise
 
 
+def prepare(df: pd.DataFrame, fill_strategy: str, outlier_cols: list) -> pd.DataFrame:
+    """
+    Run imputation, feature engineering and IQR outlier removal in one call.
+
+    Returns the same frame as handle_outliers(preprocess_data(df, fill_strategy), outlier_cols).
+    The derived ratio columns exist before the outlier mask is built, so outlier_cols may
+    also name them.
+
+    Parameters:
+    ----------
+    df : pd.DataFrame
+        Raw input data to be processed.
+    fill_strategy : str
+        Strategy to fill missing values ('mean','median','mode').
+    outlier_cols : list
+        List of numerical column names to be checked for outliers.
+
+    Returns:
+    ----------
+    pd.DataFrame
+        Cleaned DataFrame with derived features and outliers removed.
 
+    Raises:
+    ----------
+    ValueError
+        If fill_strategy is not recognized.
+    KeyError
+        If any of the outlier columns are not present in the DataFrame.
+    """
+    try:
+        # The row mask below returns a new frame, so the cleaned columns need no copy of their own
+        df = _add_ratio_features(_clean_columns(df, fill_strategy, deep=False))
+        return df.loc[_outlier_mask(df, outlier_cols)]
+    except Exception as e:
+        print(f"Error preparing data: {e}")
+        raise
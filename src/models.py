@@ -1,12 +1,94 @@
+import numpy as np
 import pandas as pd
-from sklearn.linear_model import LinearRegression
 from sklearn.tree import DecisionTreeRegressor
-from sklearn.metrics import r2_score, mean_squared_error
+from sklearn.ensemble import HistGradientBoostingRegressor
 import json
 import os
 
 
-def train_linear_regression(X_train: pd.DataFrame, y_train: pd.Series) -> LinearRegression:
+def _to_float_array(data) -> np.ndarray:
+    """
+    Helper function to convert features or targets to a float64 NumPy array.
+    """
+    # pandas converts mixed float/bool frames column-wise here; np.asarray would
+    # go through a much slower object-dtype interleave first
+    if isinstance(data, (pd.DataFrame, pd.Series)):
+        return data.to_numpy(dtype=np.float64)
+    return np.asarray(data, dtype=np.float64)
+
+
+class NormalEquationRegressor:
+    """
+    Ordinary least squares regression solved directly from the normal equations.
+
+    Attributes:
+    ----------
+    coef_ : np.ndarray
+        Estimated coefficients for each feature.
+    intercept_ : float
+        Independent term of the linear model.
+    """
+
+    # Above this condition number of X.T @ X the normal equations lose too much
+    # precision, so the fit falls back to an SVD-based least squares solve.
+    max_condition = 1e12
+
+    def fit(self, X, y):
+        """
+        Fit the model by solving (X.T @ X) coef = X.T @ y on mean-centered data.
+
+        Parameters:
+        ----------
+        X : pd.DataFrame or np.ndarray
+            Training features.
+        y : pd.Series or np.ndarray
+            Training target values.
+
+        Returns:
+        ----------
+        NormalEquationRegressor
+            The fitted model.
+        """
+        X_arr = _to_float_array(X)
+        y_arr = _to_float_array(y)
+
+        # Centering the data lets the intercept be recovered without an extra column
+        X_mean = X_arr.mean(axis=0)
+        y_mean = y_arr.mean()
+        X_centered = X_arr - X_mean
+        y_centered = y_arr - y_mean
+
+        XtX = X_centered.T @ X_centered
+        Xty = X_centered.T @ y_centered
+        try:
+            if np.linalg.cond(XtX) > self.max_condition:
+                raise np.linalg.LinAlgError("Normal equations are ill-conditioned.")
+            coef = np.linalg.solve(XtX, Xty)
+        except np.linalg.LinAlgError:
+            coef = np.linalg.lstsq(X_centered, y_centered, rcond=None)[0]
+
+        self.coef_ = coef
+        self.intercept_ = float(y_mean - X_mean @ coef)
+        return self
+
+    def predict(self, X):
+        """
+        Predict target values for the given features.
+
+        Parameters:
+        ----------
+        X : pd.DataFrame or np.ndarray
+            Features to predict on.
+
+        Returns:
+        ----------
+        np.ndarray
+            Predicted target values.
+        """
+        return _to_float_array(X) @ self.coef_ + self.intercept_
+
+
+def train_linear_regression(X_train: pd.DataFrame, y_train: pd.Series) -> NormalEquationRegressor:
     """
     Train a Linear Regression model on the provided training data.
 
@@ -19,7 +101,7 @@ def train_linear_regression(X_train: pd.DataFrame, y_train: pd.Series) -> Linear
 
     Returns:
     ----------
-    LinearRegression
+    NormalEquationRegressor
         The fitted Linear Regression model.
 
     Raises:
@@ -28,7 +110,7 @@ def train_linear_regression(X_train: pd.DataFrame, y_train: pd.Series) -> Linear
         If the input data contains null values or incompatible dimensions.
     """
     try:
-        model = LinearRegression()
+        model = NormalEquationRegressor()
         model.fit(X_train, y_train)
         return model
     except Exception as e:
@@ -61,13 +143,59 @@ def train_decision_tree(X_train: pd.DataFrame, y_train: pd.Series, max_depth: in
     """
     try:
         model = DecisionTreeRegressor(max_depth=max_depth, random_state=42)
-        model.fit(X_train, y_train)
+        # Trees split on float32 features internally, so cast once up front
+        model.fit(X_train.astype(np.float32, copy=False), y_train)
         return model
     except Exception as e:
         print(f"Error training Decision Tree: {e})")
         raise
 
 
+def train_hist_decision_tree(X_train: pd.DataFrame, y_train: pd.Series, max_depth: int = 5) -> HistGradientBoostingRegressor:
+    """
+    Train a single regression tree with histogram-based split finding.
+
+    A faster alternative to train_decision_tree for large training sets: one boosting
+    iteration with a learning rate of 1 fits exactly one tree on 256-bin features. Binning
+    makes the splits slightly coarser, and the model has no feature_importances_.
+
+    Parameters:
+    ----------
+    X_train : pd.DataFrame
+        Training features.
+    y_train : pd.Series
+        Training target values (Price).
+    max_depth : int, optional
+        The maximum depth of the tree (default is 5).
+
+    Returns:
+    ----------
+    HistGradientBoostingRegressor
+        The fitted histogram-based tree model.
+
+    Raises:
+    ----------
+    ValueError
+        If the input data is invalid.
+    """
+    try:
+        model = HistGradientBoostingRegressor(
+            max_iter=1,
+            learning_rate=1.0,
+            max_depth=max_depth,
+            max_leaf_nodes=None,
+            min_samples_leaf=1,
+            l2_regularization=0.0,
+            early_stopping=False,
+            random_state=42,
+        )
+        model.fit(X_train, y_train)
+        return model
+    except Exception as e:
+        print(f"Error training histogram Decision Tree: {e}")
+        raise
+
+
 def evaluate_model(model, X_test: pd.DataFrame, y_test: pd.Series) -> dict:
     """
     Evaluate a regression model using R-squared and Mean Squared Error.
@@ -92,8 +220,21 @@ def evaluate_model(model, X_test: pd.DataFrame, y_test: pd.Series) -> dict:
         If evaluation fails.
     """
     try:
-        r2 = r2_score(y_test, model.predict(X_test))
-        mse = mean_squared_error(y_test, model.predict(X_test))
+        y_true = np.asarray(y_test, dtype=np.float64)
+        y_pred = np.asarray(model.predict(X_test), dtype=np.float64)
+
+        # Both metrics derive from the residual and total sums of squares
+        residuals = y_true - y_pred
+        centered = y_true - y_true.mean()
+        ss_res = np.dot(residuals, residuals)
+        ss_tot = np.dot(centered, centered)
+
+        if ss_tot == 0:
+            # Constant target: report a perfect or a null fit instead of -inf/nan, as r2_score does
+            r2 = 1.0 if ss_res == 0 else 0.0
+        else:
+            r2 = float(1.0 - ss_res / ss_tot)
+        mse = float(ss_res / y_true.shape[0])
         return {
             'R2': round(r2, 4),
             'MSE': round(mse, 4)
@@ -134,8 +275,18 @@ def save_results(metrics: dict, filename: str):
         os.makedirs(output_dir, exist_ok=True)
         file_path = os.path.join(output_dir, filename)
 
-        with open(file_path, 'w') as f:
-            json.dump(metrics, f, indent=4)
+        # Serialise before touching the disk, then write to a temporary file and move it
+        # into place so a failure never leaves a partial JSON behind
+        payload = json.dumps(metrics, indent=4)
+        tmp_path = file_path + '.tmp'
+        try:
+            with open(tmp_path, 'w') as f:
+                f.write(payload)
+            os.replace(tmp_path, file_path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
         print(f"Metrics saved successfully to {file_path}")
 
     except Exception as e:
@@ -1,10 +1,16 @@
+import matplotlib
+# Figures are only written to disk, so skip any interactive GUI backend
+matplotlib.use('Agg')
 import matplotlib.pyplot as plt
 import seaborn as sns
+import numpy as np
 import pandas as pd
 import os
+from scipy.signal import fftconvolve
 
 # Global styling
 sns.set_theme(style="whitegrid")
+plt.rcParams['path.simplify_threshold'] = 1.0
 
 def _save_and_clean(filename: str):
     """
@@ -13,9 +19,28 @@ def _save_and_clean(filename: str):
     output_dir = "../reports/figures"
     os.makedirs(output_dir, exist_ok=True)
     plt.tight_layout()
-    plt.savefig(os.path.join(output_dir, filename))
+    plt.savefig(os.path.join(output_dir, filename), dpi=90)
     plt.close()
 
+def _fft_kde(values: np.ndarray, grid_size: int = 512):
+    """
+    Helper function to estimate a Gaussian KDE by smoothing a fine histogram with an FFT convolution.
+    """
+    # Scott's rule, the same bandwidth seaborn's kdeplot uses by default
+    bandwidth = values.std(ddof=1) * values.size ** (-1 / 5)
+    counts, edges = np.histogram(values, bins=grid_size,
+                                 range=(values.min() - 3 * bandwidth, values.max() + 3 * bandwidth))
+    grid_width = edges[1] - edges[0]
+    sigma = bandwidth / grid_width
+
+    half_width = min(int(np.ceil(4 * sigma)), grid_size - 1)
+    offsets = np.arange(-half_width, half_width + 1)
+    kernel = np.exp(-0.5 * (offsets / sigma) ** 2)
+    kernel /= kernel.sum()
+
+    density = fftconvolve(counts, kernel, mode='same') / (values.size * grid_width)
+    return (edges[:-1] + edges[1:]) / 2, density
+
 def plot_distribution(df: pd.DataFrame, column: str):
     """
     Create a distribution plot (Histogram + KDE) for a numerical column.
@@ -42,7 +67,19 @@ def plot_distribution(df: pd.DataFrame, column: str):
             raise KeyError(f"Column '{column}' not found.")
 
         plt.figure(figsize=(10, 6))
-        sns.histplot(df[column], kde=True, color='teal')
+        if not pd.api.types.is_numeric_dtype(df[column]):
+            # Text and categorical columns have no numeric bins, so let seaborn count them
+            sns.histplot(df[column], kde=True, color='teal')
+        else:
+            values = df[column].dropna().to_numpy(dtype=np.float64)
+            counts, edges = np.histogram(values, bins='auto')
+            plt.bar(edges[:-1], counts, width=np.diff(edges), align='edge',
+                    color='teal', alpha=0.75, edgecolor='white', linewidth=0.5)
+            if values.size > 1 and values.std() > 0:
+                # Scale the density to bar heights and clip it to the data range, as histplot does
+                grid, density = _fft_kde(values)
+                inside = (grid >= values.min()) & (grid <= values.max())
+                plt.plot(grid[inside], density[inside] * values.size * np.diff(edges).mean(), color='teal')
         plt.title(f'Distribution Analysis: {column}')
         plt.xlabel(column)
         plt.ylabel('Frequency')
@@ -74,9 +111,17 @@ def plot_correlation_heatmap(df: pd.DataFrame):
     try:
         plt.figure(figsize=(12, 10))
         numeric_df = df.select_dtypes(include=['number'])
-        correlation = numeric_df.corr()
+        columns = numeric_df.columns
+
+        # Correlate complete rows only. All-NaN columns would leave no complete rows,
+        # so they are set aside and shown as blank cells, like DataFrame.corr() does
+        valid = numeric_df.notna().any().to_numpy()
+        values = numeric_df.loc[:, valid].dropna().to_numpy(dtype=np.float64)
+        correlation = np.full((len(columns), len(columns)), np.nan)
+        correlation[np.ix_(valid, valid)] = np.atleast_2d(np.corrcoef(values, rowvar=False))
 
-        sns.heatmap(correlation, annot=True, cmap='coolwarm', fmt='.2f', linewidths=0.5)
+        sns.heatmap(correlation, xticklabels=columns, yticklabels=columns,
+                    annot=True, cmap='coolwarm', fmt='.2f', linewidths=0.5, rasterized=True)
         plt.title('Feature Correlation Heatmap')
 
         _save_and_clean("correlation_heatmap.png")
@@ -112,9 +157,11 @@ def plot_scatter_with_trend(df: pd.DataFrame, x_col: str, y_col: str):
             raise KeyError("Specified columns not found in DataFrame.")
 
         plt.figure(figsize=(10, 6))
-        sns.regplot(data=df, x=x_col, y=y_col,
-                    scatter_kws={'alpha': 0.3, 'color': 'gray'},
-                    line_kws={'color': 'red'})
+        # Draw a random subset of points; the trend line is still fitted on all rows
+        n = len(df)
+        idx = np.random.default_rng(0).choice(n, size=min(n, 2000), replace=False)
+        sns.scatterplot(data=df.iloc[idx], x=x_col, y=y_col, alpha=0.3, color='gray', edgecolor=None)
+        sns.regplot(data=df, x=x_col, y=y_col, scatter=False, line_kws={'color': 'red'})
         plt.title(f'Relationship Analysis: {x_col} vs {y_col}')
 
         _save_and_clean(f"scatter_{x_col}_vs_{y_col}.png")
@@ -184,9 +231,42 @@ def plot_outlier_boxplot(df: pd.DataFrame, columns: list):
     """
     try:
         plt.figure(figsize=(12, 6))
-        # Melt dataframe to plot multiple numerical columns together
-        melted_df = df[columns].melt()
-        sns.boxplot(x='variable', y='value', hue='variable', data=melted_df, legend=False)
+        values = df[columns].to_numpy(dtype=np.float64)
+        # All-NaN columns get an empty slot, as in seaborn, instead of a box
+        present = np.flatnonzero(~np.isnan(values).all(axis=0))
+        present_values = values[:, present]
+        quantile = np.nanquantile if np.isnan(present_values).any() else np.quantile
+        # All quartiles in one call, then Tukey whiskers at 1.5 * IQR
+        Q1, median, Q3 = quantile(present_values, [0.25, 0.5, 0.75], axis=0)
+        IQR = Q3 - Q1
+        lower_bound = Q1 - 1.5 * IQR
+        upper_bound = Q3 + 1.5 * IQR
+
+        stats = []
+        for k, i in enumerate(present):
+            col_values = present_values[:, k]
+            inside = (col_values >= lower_bound[k]) & (col_values <= upper_bound[k])
+            stats.append({
+                'label': columns[i],
+                'q1': Q1[k],
+                'med': median[k],
+                'q3': Q3[k],
+                'whislo': col_values[inside].min(),
+                'whishi': col_values[inside].max(),
+                'fliers': col_values[~inside & ~np.isnan(col_values)],
+            })
+
+        ax = plt.gca()
+        if stats:
+            artists = ax.bxp(stats, positions=present + 1, widths=0.8, patch_artist=True,
+                             medianprops={'color': '0.25'})
+            palette = sns.color_palette(n_colors=len(columns))
+            for box, i in zip(artists['boxes'], present):
+                box.set_facecolor(palette[i])
+        ax.set_xticks(np.arange(1, len(columns) + 1), labels=columns)
+        ax.set_xlim(0.5, len(columns) + 0.5)
+        ax.set_xlabel('variable')
+        ax.set_ylabel('value')
         plt.title('Outlier Analysis of Key Variables')
         plt.xticks(rotation=45)
 